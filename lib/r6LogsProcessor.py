@@ -1,9 +1,17 @@
+import gc
+import heapq
 import json
 import os
+import pickle
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import length_hint
+from typing import Dict, Iterable, Iterator, List, Tuple, Any
 
 
 def load_config(config_file: str = r'.\config\config.json') -> Dict[str, Any]:
@@ -22,35 +30,114 @@ def load_config(config_file: str = r'.\config\config.json') -> Dict[str, Any]:
 
 config = load_config()
 
+# Size of the blocks log files are read in, keeping the working set bounded
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _new_operator_stats() -> List[int]:
+    """
+    Default factory for operator entries, kept at module level so summaries can be pickled.
+
+    Returns:
+        List[int]: A fresh [kills, matches] pair.
+    """
+    return [0, 0]
+
+
+@lru_cache(maxsize=4096)
+def _format_rate(kills: int, matches: int) -> bytes:
+    """
+    Format a kills per match rate, memoized since the same small (kills, matches) pairs recur.
+
+    Args:
+        kills (int): Total kills.
+        matches (int): Number of matches.
+
+    Returns:
+        bytes: Rate formatted with two decimals.
+    """
+    return b'%.2f' % (kills / matches)
+
 
 class LogProcessor(ABC):
     """
     Abstract base class for log processors.
+
+    process_logs may process log files in worker processes, where each processor is
+    rebuilt as `type(processor)(processor.config)` and only its summary is sent back.
+    Subclasses must therefore be module-level classes whose constructor takes the
+    configuration alone, and must not rely on instance state set after construction.
     """
 
     def __init__(self):
         """
         Initialize the log processor.
         """
-        self.data = defaultdict(lambda: defaultdict(int))
+        self.data = defaultdict(partial(defaultdict, int))
+        # Canonical instance of every ID seen by process_rows, so repeated IDs share one
+        # bytes object. Merged summaries keep the key objects they were built with.
+        self._interned = {}
+
+    def process_log_line(self, line: bytes) -> None:
+        """
+        Process a single log line through the same accumulation kernel as process_rows.
+
+        Args:
+            line (bytes): A line from the log file to be processed.
+        """
+        self.process_rows((line.strip().split(b','),))
 
     @abstractmethod
-    def process_log_line(self, line: str) -> None:
+    def process_rows(self, rows: Iterable[List[bytes]]) -> None:
         """
-        Abstract method to process a single log line.
+        Abstract method to process a batch of tokenized log rows.
+
+        Rows must be consumed lazily, one per iteration, and an error raised for a row
+        only after that row has been pulled. Callers rely on this to report the
+        malformed line and resume from the next row with the same iterator.
 
         Args:
-            line (str): A line from the log file to be processed.
+            rows (Iterable[List[bytes]]): Rows of [player_id, match_id, operator_id, nb_kills].
+        """
+        pass
+
+    def merge(self, summary: Dict[Any, Any]) -> None:
+        """
+        Fold a partial summary into the processed data, leaving the summary untouched.
+
+        Args:
+            summary (Dict[Any, Any]): Summary produced by another processor of the same type.
+        """
+        self._merge(summary, adopt=False)
+
+    def _adopt(self, summary: Dict[Any, Any]) -> None:
+        """
+        Fold a partial summary handed over by its owner, such as one unpickled from a worker.
+        Entries not seen yet are taken as-is instead of being copied.
+
+        Args:
+            summary (Dict[Any, Any]): Summary produced by another processor of the same type.
+        """
+        self._merge(summary, adopt=True)
+
+    @abstractmethod
+    def _merge(self, summary: Dict[Any, Any], adopt: bool) -> None:
+        """
+        Abstract method to fold a partial summary into the processed data.
+
+        Args:
+            summary (Dict[Any, Any]): Summary produced by another processor of the same type.
+            adopt (bool): Whether entries not seen yet may be taken without copying.
         """
         pass
 
     @property
-    def summary(self) -> Dict[str, Dict[str, Any]]:
+    def summary(self) -> Dict[Any, Any]:
         """
         Property that returns the processed data summary.
 
         Returns:
-            Dict[str, Dict[str, Any]]: Summary of processed log data.
+            Dict[Any, Any]: Summary of processed log data.
         """
         return self.data
 
@@ -79,18 +166,68 @@ class OperatorLogProcessor(LogProcessor):
         """
         super().__init__()
         self.config = config
-        self.data = defaultdict(lambda: defaultdict(lambda: {'kills': 0, 'matches': 0}))
+        # Flat (operator_id, match_id) -> [kills, matches] mapping
+        self.data = defaultdict(_new_operator_stats)
+        # Top-N selector specialized once with the configured N
+        self._select_top = partial(heapq.nsmallest, config['TOP_N_OPERATOR_KILLS'])
 
-    def process_log_line(self, line: str) -> None:
+    def process_rows(self, rows: Iterable[List[bytes]]) -> None:
         """
-        Process a single log line and update operator kill statistics.
+        Process a batch of tokenized log rows and update operator kill statistics.
 
         Args:
-            line (str): A line from the log file.
+            rows (Iterable[List[bytes]]): Rows of [player_id, match_id, operator_id, nb_kills].
         """
-        player_id, match_id, operator_id, nb_kills = line.strip().split(',')
-        self.data[operator_id][match_id]['kills'] += int(nb_kills)
-        self.data[operator_id][match_id]['matches'] += 1
+        data = self.data
+        intern = self._interned.setdefault
+        for player_id, match_id, operator_id, nb_kills in rows:
+            kills = int(nb_kills)
+            entry = data[(intern(operator_id, operator_id), intern(match_id, match_id))]
+            entry[0] += kills
+            entry[1] += 1
+
+    def _merge(self, summary: Dict[Any, Any], adopt: bool) -> None:
+        """
+        Fold a partial operator summary into the processed data.
+
+        Args:
+            summary (Dict[Any, Any]): Summary produced by another operator log processor.
+            adopt (bool): Whether entries not seen yet may be taken without copying.
+        """
+        # Unseen keys take the summary's entry, so only overlapping keys pay for the add
+        data = self.data
+        get = data.get
+        for key, stats in summary.items():
+            entry = get(key)
+            if entry is None:
+                data[key] = stats if adopt else stats.copy()
+            else:
+                entry[0] += stats[0]
+                entry[1] += stats[1]
+
+    def _report_lines(self) -> Iterator[bytes]:
+        """
+        Lazily build the operator report, one line per operator.
+
+        Yields:
+            bytes: Report line for an operator, without line terminator.
+        """
+        select_top = self._select_top
+
+        # Group the flat (operator_id, match_id) entries per operator, computing the
+        # ratio once per entry. Negating it lets tuples order by (-ratio, match_id).
+        buckets = defaultdict(list)
+        for (operator_id, match_id), (kills, matches) in self.data.items():
+            buckets[operator_id].append((-kills / matches, match_id, kills, matches))
+
+        for operator_id, match_data in buckets.items():
+            top_matches = select_top(match_data)
+            
+            match_report = b",".join([
+                match_id + b":" + _format_rate(kills, matches) 
+                for _, match_id, kills, matches in top_matches
+            ])
+            yield operator_id + b"|" + match_report
 
     def generate_report(self, date: str) -> None:
         """
@@ -99,25 +236,16 @@ class OperatorLogProcessor(LogProcessor):
         Args:
             date (str): The date string used in the report file naming.
         """
-        report_lines = []
-        for operator_id, match_data in self.data.items():
-            sorted_matches = sorted(
-                match_data.items(), 
-                key=lambda x: (-x[1]['kills'] / x[1]['matches'], x[0])
-            )[:self.config['TOP_N_OPERATOR_KILLS']]
-            
-            match_report = ",".join(
-                f"{match_id}:{data['kills'] / data['matches']:.2f}" 
-                for match_id, data in sorted_matches
-            )
-            report_lines.append(f"{operator_id}|{match_report}")
-        
         report_path = os.path.join(
             self.config['REPORT_FOLDER'], 
             f'operator_top{self.config["TOP_N_OPERATOR_KILLS"]}_{date}.txt'
         )
-        with open(report_path, 'w') as file:
-            file.write('\n'.join(report_lines))
+        # Stream lines to the file instead of joining the whole report in memory.
+        # The operator report has no trailing newline.
+        report_lines = self._report_lines()
+        with open(report_path, 'wb', buffering=1 << 20) as file:
+            file.write(next(report_lines, b''))
+            file.writelines(b'\n' + line for line in report_lines)
 
 
 class PlayerLogProcessor(LogProcessor):
@@ -134,43 +262,193 @@ class PlayerLogProcessor(LogProcessor):
         """
         super().__init__()
         self.config = config
+        # Top-N selector specialized once with the configured N and ranking key
+        self._select_top = partial(
+            heapq.nsmallest, 
+            config['TOP_N_PLAYERS'], 
+            key=lambda x: (-x[1], x[0])
+        )
 
-    def process_log_line(self, line: str) -> None:
+    def process_rows(self, rows: Iterable[List[bytes]]) -> None:
         """
-        Process a single log line and update player kill statistics.
+        Process a batch of tokenized log rows and update player kill statistics.
 
         Args:
-            line (str): A line from the log file.
+            rows (Iterable[List[bytes]]): Rows of [player_id, match_id, operator_id, nb_kills].
         """
-        player_id, match_id, operator_id, nb_kills = line.strip().split(',')
-        self.data[player_id][match_id] += int(nb_kills)
+        data = self.data
+        intern = self._interned.setdefault
+        for player_id, match_id, operator_id, nb_kills in rows:
+            data[player_id][intern(match_id, match_id)] += int(nb_kills)
 
-    def generate_report(self, date: str) -> None:
+    def _merge(self, summary: Dict[Any, Any], adopt: bool) -> None:
         """
-        Generate a report of top players based on total kills per match.
+        Fold a partial player summary into the processed data.
 
         Args:
-            date (str): The date string used in the report file naming.
+            summary (Dict[Any, Any]): Summary produced by another player log processor.
+            adopt (bool): Whether match dicts of unseen players may be taken without copying.
+        """
+        # Unseen players take the summary's match dict in one piece
+        data = self.data
+        get = data.get
+        for player_id, match_kills in summary.items():
+            player_data = get(player_id)
+            if player_data is None:
+                data[player_id] = match_kills if adopt else defaultdict(int, match_kills)
+                continue
+            for match_id, nb_kills in match_kills.items():
+                player_data[match_id] += nb_kills
+
+    def _report_lines(self) -> Iterator[bytes]:
         """
-        player_top_n = []
+        Lazily build the player report, one line per player.
+
+        Yields:
+            bytes: Report line for a player, without line terminator.
+        """
+        select_top = self._select_top
+        match_format = b'%s:%d'
+
         for player_id, match_kills in self.data.items():
-            sorted_matches = sorted(
-                match_kills.items(), 
-                key=lambda x: (-x[1], x[0])
-            )[:self.config['TOP_N_PLAYERS']]
+            top_matches = select_top(match_kills.items())
             
-            report_string = f"{player_id}|" + ",".join(
-                f"{match_id}:{nb_kills}" 
-                for match_id, nb_kills in sorted_matches
-            )
-            player_top_n.append(report_string)
+            yield player_id + b"|" + b",".join([
+                match_format % match 
+                for match in top_matches
+            ])
 
+    def generate_report(self, date: str) -> None:
+        """
+        Generate a report of top players based on total kills per match.
+
+        Args:
+            date (str): The date string used in the report file naming.
+        """
         report_path = os.path.join(
             self.config['REPORT_FOLDER'], 
             f'player_top{self.config["TOP_N_PLAYERS"]}_{date}.txt'
         )
-        with open(report_path, 'w') as file:
-            file.write("\n".join(player_top_n) + "\n")
+        # Stream lines to the file instead of joining the whole report in memory.
+        # An empty report is still a single newline.
+        report_lines = self._report_lines()
+        with open(report_path, 'wb', buffering=1 << 20) as file:
+            file.write(next(report_lines, b'') + b'\n')
+            file.writelines(line + b'\n' for line in report_lines)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while bulk-building summaries.
+
+    The summaries are millions of small acyclic containers, so collections triggered by
+    their allocation only rescan them. Reference counting still frees everything else.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _process_lines(processors: List[LogProcessor], lines: List[bytes], log_file: str, first_idx: int) -> None:
+    """
+    Tokenize a block of log lines once and feed it to every processor.
+
+    Args:
+        processors (List[LogProcessor]): Log processors to feed.
+        lines (List[bytes]): Log lines, without line terminators.
+        log_file (str): Log file path, used in error messages.
+        first_idx (int): Index of the first line within the log file.
+    """
+    # Strip and tokenize with bytes methods mapped in C, and share the rows between
+    # processors. On a malformed line, report it and resume from the next row.
+    rows = list(map(bytes.split, map(bytes.strip, lines), repeat(b',')))
+    for processor in processors:
+        remaining = iter(rows)
+        while True:
+            left = length_hint(remaining)
+            try:
+                processor.process_rows(remaining)
+                break
+            except Exception as e:
+                # Raising before consuming a row would retry the same row forever
+                if length_hint(remaining) >= left:
+                    raise
+                idx = first_idx + len(rows) - length_hint(remaining) - 1
+                print(f"Error processing log line ({idx}) in file {log_file}: {e}")
+
+
+def process_log_file(processors: List[LogProcessor], log_file: str) -> None:
+    """
+    Process a single log file with the given processors, parsing each line once.
+
+    Args:
+        processors (List[LogProcessor]): Log processors to feed.
+        log_file (str): Log file path.
+    """
+    # Read the file as bytes in fixed-size chunks, skipping the UTF-8 decode, so memory
+    # stays bounded whatever the log size. The partial last line of each chunk is
+    # carried over to the next one. IDs stay bytes through to the reports.
+    first_idx = 0
+    pending = b''
+    with _gc_paused(), open(log_file, 'rb') as file:
+        while chunk := file.read(CHUNK_SIZE):
+            lines = chunk.split(b'\n')
+            lines[0] = pending + lines[0]
+            pending = lines.pop()
+            _process_lines(processors, lines, log_file, first_idx)
+            first_idx += len(lines)
+
+        if pending:
+            _process_lines(processors, [pending], log_file, first_idx)
+
+
+def _process_file(log_file: str, processor_specs: List[Tuple[type, Dict[str, Any]]]) -> List[Dict[Any, Any]]:
+    """
+    Worker entry point: process one log file with fresh processors.
+
+    Args:
+        log_file (str): Log file path.
+        processor_specs (List[Tuple[type, Dict[str, Any]]]): LogProcessor subclass and
+            configuration of each processor to instantiate.
+
+    Returns:
+        List[Dict[Any, Any]]: Partial summary for the log file, one per processor.
+    """
+    processors = [processor_cls(config) for processor_cls, config in processor_specs]
+    process_log_file(processors, log_file)
+    return [processor.summary for processor in processors]
+
+
+def _processor_specs(processors: List[LogProcessor]) -> List[Tuple[type, Dict[str, Any]]]:
+    """
+    Build the specs worker processes use to rebuild the given processors.
+
+    Args:
+        processors (List[LogProcessor]): List of log processors.
+
+    Returns:
+        List[Tuple[type, Dict[str, Any]]]: LogProcessor subclass and configuration of each processor.
+
+    Raises:
+        TypeError: If a processor cannot be rebuilt as `type(processor)(processor.config)`
+            in a worker process.
+    """
+    processor_specs = [(type(processor), processor.config) for processor in processors]
+    for processor_cls, config in processor_specs:
+        try:
+            pickle.dumps((processor_cls, config))
+            processor_cls(config)
+        except Exception as e:
+            raise TypeError(
+                f"{processor_cls.__qualname__} must be a module-level LogProcessor "
+                f"that can be rebuilt from its config alone: {e}"
+            ) from e
+    return processor_specs
 
 
 def process_logs(processors: List[LogProcessor]) -> None:
@@ -182,19 +460,27 @@ def process_logs(processors: List[LogProcessor]) -> None:
     """
     today = datetime.today().strftime('%Y%m%d')
     log_files = get_last_n_days_log_files(processors[0].config)
+    # Validated on every path so the outcome does not depend on the CPU count
+    processor_specs = _processor_specs(processors)
+    cpu_count = os.cpu_count() or 1
 
-    # Process daily logs for each processor
-    for processor in processors:
+    if len(log_files) == 1 or cpu_count == 1:
+        # Nothing to parallelize: a pool would only add the cost of pickling each
+        # file's summary back, so feed the processors in-process
         for log_file in log_files:
-            with open(log_file, 'r') as file:
-                for idx, line in enumerate(file):
-                    try:
-                        processor.process_log_line(line)
-                    except Exception as e:
-                        print(f"Error processing log line ({idx}) in file {log_file}: {e}")
+            process_log_file(processors, log_file)
+    else:
+        # Process daily logs, one worker per file feeding every processor, and merge
+        # the partial summaries in file order
+        max_workers = min(len(log_files), cpu_count)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor, _gc_paused():
+            for partial_summaries in executor.map(_process_file, log_files, repeat(processor_specs)):
+                for processor, partial_summary in zip(processors, partial_summaries):
+                    processor._adopt(partial_summary)
+
+    # Generate reports for each processor
+    for processor in processors:
         processor.summary
-
-        # Generate reports for each processor
         processor.generate_report(today)
 
 
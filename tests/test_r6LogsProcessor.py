@@ -2,7 +2,12 @@ import unittest
 import os
 from datetime import datetime, timedelta
 import glob
-from lib.r6LogsProcessor import PlayerLogProcessor, OperatorLogProcessor, process_logs, load_config
+import io
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from unittest import mock
+from lib.r6LogsProcessor import PlayerLogProcessor, OperatorLogProcessor, process_logs, process_log_file, load_config
 
 class TestProcessR6Logs(unittest.TestCase):
 
@@ -65,6 +70,169 @@ class TestProcessR6Logs(unittest.TestCase):
 
         self.assertEqual(actual_report_content, expected_report_content, f"Operator report content mismatch: {actual_report_content}")
 
+    def test_operator_summary(self):
+        """Test the operator summary is keyed by (operator_id, match_id)."""
+        processor = OperatorLogProcessor(self.config)
+        processor.process_rows(line.encode().split(b',') for line in self.mock_log_data)
+
+        expected_summary = {
+            (b'operator1', b'match1'): [8, 2],
+            (b'operator2', b'match2'): [2, 1],
+            (b'operator1', b'match2'): [4, 1],
+            (b'operator2', b'match3'): [1, 1],
+        }
+        self.assertEqual(dict(processor.summary), expected_summary)
+
+    def test_merge_partial_summaries(self):
+        """Test merging per-file summaries matches processing all rows at once."""
+        rows = [line.encode().split(b',') for line in self.mock_log_data]
+
+        for processor_cls in (OperatorLogProcessor, PlayerLogProcessor):
+            expected_processor = processor_cls(self.config)
+            expected_processor.process_rows(rows + rows)
+
+            processor = processor_cls(self.config)
+            partial_processors = []
+            for _ in range(2):
+                partial_processor = processor_cls(self.config)
+                partial_processor.process_rows(rows)
+                processor.merge(partial_processor.summary)
+                partial_processors.append(partial_processor)
+
+            self.assertEqual(processor.summary, expected_processor.summary)
+
+            # Merged entries are copies: further work on a partial processor does not leak
+            for partial_processor in partial_processors:
+                partial_processor.process_rows(rows)
+            self.assertEqual(processor.summary, expected_processor.summary)
+
+    def test_process_rows_without_progress_raises(self):
+        """Test a processor failing before consuming a row is not retried forever."""
+        class FailingProcessor(PlayerLogProcessor):
+            def process_rows(self, rows):
+                raise RuntimeError('no row consumed')
+
+        log_file_path = os.path.join(self.config['LOGS_FOLDER'], 'r6-matches-failing.log')
+        with open(log_file_path, 'w') as file:
+            file.write('\n'.join(self.mock_log_data))
+
+        with self.assertRaises(RuntimeError):
+            process_log_file([FailingProcessor(self.config)], log_file_path)
+
+    def test_single_cpu_runs_in_process(self):
+        """Test logs are processed without a worker pool on a single CPU."""
+        processor = PlayerLogProcessor(self.config)
+        with mock.patch('lib.r6LogsProcessor.os.cpu_count', return_value=1), \
+                mock.patch('lib.r6LogsProcessor.ProcessPoolExecutor') as executor:
+            process_logs([processor])
+
+        executor.assert_not_called()
+        self.assertEqual(dict(processor.summary[b'player1']), {b'match1': 35, b'match2': 14, b'match3': 7})
+
+    def test_padded_lines_are_stripped(self):
+        """Test surrounding whitespace is stripped the same way for files and single lines."""
+        log_file_path = os.path.join(self.config['LOGS_FOLDER'], 'r6-matches-padded.log')
+        with open(log_file_path, 'w') as file:
+            file.write(' player1,match1,operator1,5 \r\n\tplayer2,match1,operator1,3\n')
+
+        processor = PlayerLogProcessor(self.config)
+        process_log_file([processor], log_file_path)
+
+        line_processor = PlayerLogProcessor(self.config)
+        line_processor.process_log_line(b' player1,match1,operator1,5 \r\n')
+        line_processor.process_log_line(b'\tplayer2,match1,operator1,3\n')
+
+        expected_summary = {b'player1': {b'match1': 5}, b'player2': {b'match1': 3}}
+        self.assertEqual(processor.summary, expected_summary)
+        self.assertEqual(line_processor.summary, expected_summary)
+
+    def test_malformed_lines_across_chunks(self):
+        """Test malformed lines are reported at their index and later rows still count."""
+        log_lines = [
+            "player1,match1,operator1,5",
+            "player1,match1,operator1,x",
+            "player2,match1,operator1,3",
+            "bad",
+            "",
+            "player1,match2,operator2,2",
+            "player2,match2,operator1,4,extra",
+            "player2,match2,operator1,4",
+        ]
+        log_file_path = os.path.join(self.config['LOGS_FOLDER'], 'r6-matches-malformed.log')
+        with open(log_file_path, 'w') as file:
+            file.write('\n'.join(log_lines) + '\n')
+
+        expected_operator_summary = {
+            (b'operator1', b'match1'): [8, 2],
+            (b'operator2', b'match2'): [2, 1],
+            (b'operator1', b'match2'): [4, 1],
+        }
+        expected_player_summary = {
+            b'player1': {b'match1': 5, b'match2': 2},
+            b'player2': {b'match1': 3, b'match2': 4},
+        }
+
+        for chunk_size in (1, 7, 27, 28, 64, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                operator_processor = OperatorLogProcessor(self.config)
+                player_processor = PlayerLogProcessor(self.config)
+                output = io.StringIO()
+                with mock.patch('lib.r6LogsProcessor.CHUNK_SIZE', chunk_size), redirect_stdout(output):
+                    process_log_file([operator_processor, player_processor], log_file_path)
+
+                reported = sorted(int(idx) for idx in re.findall(r'log line \((\d+)\)', output.getvalue()))
+                self.assertEqual(reported, [1, 1, 3, 3, 4, 4, 6, 6])
+                self.assertEqual(dict(operator_processor.summary), expected_operator_summary)
+                self.assertEqual(player_processor.summary, expected_player_summary)
+
+    def test_worker_pool_matches_in_process(self):
+        """Test reports built through the worker pool match the in-process reports."""
+        today = datetime.today().strftime('%Y%m%d')
+        report_paths = [
+            os.path.join(self.config['REPORT_FOLDER'], f'operator_top{self.config["TOP_N_OPERATOR_KILLS"]}_{today}.txt'),
+            os.path.join(self.config['REPORT_FOLDER'], f'player_top{self.config["TOP_N_PLAYERS"]}_{today}.txt'),
+        ]
+
+        reports = {}
+        for cpu_count in (1, 4):
+            processors = [OperatorLogProcessor(self.config), PlayerLogProcessor(self.config)]
+            with mock.patch('lib.r6LogsProcessor.os.cpu_count', return_value=cpu_count), \
+                    mock.patch('lib.r6LogsProcessor.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as executor:
+                process_logs(processors)
+
+            self.assertEqual(executor.called, cpu_count > 1)
+            reports[cpu_count] = []
+            for report_path in report_paths:
+                with open(report_path, 'rb') as report_file:
+                    reports[cpu_count].append(report_file.read())
+
+        self.assertEqual(reports[4], reports[1])
+
+    def test_unrebuildable_processor_is_rejected(self):
+        """Test processors that workers cannot rebuild are rejected on every path."""
+        class LocalProcessor(PlayerLogProcessor):
+            pass
+
+        for cpu_count in (1, 4):
+            with mock.patch('lib.r6LogsProcessor.os.cpu_count', return_value=cpu_count):
+                with self.assertRaises(TypeError):
+                    process_logs([LocalProcessor(self.config)])
+
+    def test_chunked_log_file(self):
+        """Test lines split across read chunks are stitched back together."""
+        log_file_path = os.path.join(self.config['LOGS_FOLDER'], 'r6-matches-chunked.log')
+        with open(log_file_path, 'w') as file:
+            file.write('\n'.join(self.mock_log_data) + '\n')
+
+        expected_processor = PlayerLogProcessor(self.config)
+        expected_processor.process_rows(line.encode().split(b',') for line in self.mock_log_data)
+
+        processor = PlayerLogProcessor(self.config)
+        with mock.patch('lib.r6LogsProcessor.CHUNK_SIZE', 7):
+            process_log_file([processor], log_file_path)
+
+        self.assertEqual(processor.summary, expected_processor.summary)
+
     @classmethod
     def tearDownClass(cls):
         # Clean up by removing any files created during the tests